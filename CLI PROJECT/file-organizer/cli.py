@@ -71,6 +71,12 @@ Examples:
         help='Organize files recursively in all subdirectories'
     )
     
+    parser.add_argument(
+        '--incremental',
+        action='store_true',
+        help='With --recursive, skip the run if nothing changed since the last incremental run'
+    )
+    
     parser.add_argument(
         '--dry-run',
         action='store_true',
@@ -95,8 +101,17 @@ Examples:
         help='Custom path for the log file'
     )
     
+    parser.add_argument(
+        '--workers',
+        type=int,
+        help='Number of threads used to move files (default: 1, or 64 on network filesystems)'
+    )
+    
     args = parser.parse_args()
     
+    if args.incremental and not args.recursive:
+        parser.error('--incremental requires --recursive')
+    
     # Validate directory
     target_dir = Path(args.directory)
     if not target_dir.exists():
@@ -117,7 +132,8 @@ Examples:
         organizer = FileOrganizer(
             target_directory=str(target_dir),
             categories=categories,
-            log_file=args.log_file
+            log_file=args.log_file,
+            workers=args.workers
         )
     except ValueError as e:
         print(f"Error: {e}")
@@ -142,7 +158,7 @@ Examples:
     try:
         if args.recursive:
             print(f"Organizing files recursively in: {target_dir}\n")
-            stats = organizer.organize_recursive(dry_run=args.dry_run)
+            stats = organizer.organize_recursive(dry_run=args.dry_run, incremental=args.incremental)
         else:
             print(f"Organizing files in: {target_dir}\n")
             stats = organizer.organize(dry_run=args.dry_run)
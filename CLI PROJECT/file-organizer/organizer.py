@@ -1,12 +1,88 @@
 import os
+import re
+import errno
+import fnmatch
 import shutil
 import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, List, Tuple, Union
 from datetime import datetime
 import json
 
 
+# Files written by the organizer itself, which must never be organized
+_SKIP_NAMES = frozenset({'file_organizer.log', 'organization_log.json', 'organization_log.ndjson',
+                         '.file_organizer_state'})
+
+# Filesystem types where every metadata operation is a network round trip
+_NETWORK_FS_TYPES = frozenset({
+    'nfs', 'nfs4', 'cifs', 'smbfs', 'smb3', '9p', 'afs', 'ceph', 'glusterfs', 'davfs',
+    # FUSE filesystems backed by remote storage; local ones (bindfs, mergerfs, ...) are excluded
+    'fuse.sshfs', 'fuse.rclone', 'fuse.s3fs', 'fuse.gcsfuse', 'fuse.goofys', 'fuse.juicefs',
+    'fuse.glusterfs', 'fuse.ceph-fuse',
+})
+
+# (file handler, console handler) pairs, keyed by absolute log file path, so
+# repeated FileOrganizer instances reuse the same handlers
+_HANDLER_CACHE: Dict[str, Tuple[logging.Handler, logging.Handler]] = {}
+
+
+def close_loggers():
+    """Detach and close all cached handlers and clear the cache."""
+    logger = logging.getLogger('FileOrganizer')
+    for handlers in _HANDLER_CACHE.values():
+        for handler in handlers:
+            logger.removeHandler(handler)
+            handler.close()
+    _HANDLER_CACHE.clear()
+
+
+def _is_network_filesystem(path: Union[str, Path]) -> bool:
+    """
+    Best-effort check whether a path lives on a network filesystem.
+    
+    Args:
+        path: Path to check
+        
+    Returns:
+        True if the path is on a network mount, False if local or unknown
+    """
+    path = os.path.realpath(path)
+    
+    if os.name == 'nt':
+        if path.startswith('\\\\'):
+            return True
+        try:
+            import ctypes
+            drive = os.path.splitdrive(path)[0] + '\\'
+            return ctypes.windll.kernel32.GetDriveTypeW(drive) == 4  # DRIVE_REMOTE
+        except Exception:
+            return False
+    
+    try:
+        with open('/proc/mounts', 'r') as f:
+            mounts = f.read().splitlines()
+    except OSError:
+        return False
+    
+    # Find the most specific mount point containing the path
+    best_mount, fs_type = '', ''
+    for line in mounts:
+        fields = line.split()
+        if len(fields) < 3:
+            continue
+        # Spaces and other special characters are octal-escaped, e.g. '\040'
+        mount_point = re.sub(r'\\([0-7]{3})', lambda m: chr(int(m.group(1), 8)), fields[1])
+        if (path == mount_point or path.startswith(mount_point.rstrip('/') + '/')) \
+                and len(mount_point) > len(best_mount):
+            best_mount, fs_type = mount_point, fields[2]
+    
+    return fs_type in _NETWORK_FS_TYPES
+
+
 class FileOrganizer:
     """
     A utility class to organize files in a directory by categorizing them into subfolders.
@@ -26,7 +102,12 @@ class FileOrganizer:
         'Data': ['.csv', '.sql', '.db', '.sqlite', '.json', '.xml', '.yaml']
     }
     
-    def __init__(self, target_directory: str, categories: Dict[str, List[str]] = None, log_file: str = None):
+    # Default number of move threads on network filesystems, where each
+    # rename is latency-bound rather than CPU-bound
+    NETWORK_WORKERS = 64
+    
+    def __init__(self, target_directory: str, categories: Dict[str, List[str]] = None, log_file: str = None,
+                 workers: int = None):
         """
         Initialize the FileOrganizer.
         
@@ -34,10 +115,30 @@ class FileOrganizer:
             target_directory: The directory to organize
             categories: Custom category mappings (optional)
             log_file: Path to log file (optional)
+            workers: Number of threads used to move files (optional, defaults to 1,
+                or NETWORK_WORKERS on network filesystems)
         """
         self.target_directory = Path(target_directory)
         self.categories = categories or self.DEFAULT_CATEGORIES
-        self.operations_log = []
+        
+        # Reference points for operation log timestamps
+        self._t0_wall = time.time()
+        self._t0_mono = time.monotonic()
+        
+        # Operation log and move log handles, open only while a (non dry-run)
+        # organization is running
+        self._op_log_fh = None
+        self._move_log_fh = None
+        
+        # Guards state shared between move worker threads
+        self._lock = threading.Lock()
+        
+        # Cached names of files in each destination folder (as _name_key keys),
+        # used to resolve duplicate filenames without a stat per candidate name
+        self._dest_listing: Dict[str, set] = {}
+        
+        # Highest counter used for each (stem, suffix) in each destination folder
+        self._max_suffix: Dict[str, Dict[Tuple[str, str], int]] = {}
         
         if not self.target_directory.exists():
             raise ValueError(f"Target directory does not exist: {target_directory}")
@@ -47,20 +148,66 @@ class FileOrganizer:
         
         # Setup logging
         self.log_file = log_file or self.target_directory / "file_organizer.log"
+        self._log_name = os.path.basename(str(self.log_file))
+        self._log_path = os.path.normcase(os.path.abspath(str(self.log_file)))
         self._setup_logger()
+        
+        if workers is None:
+            workers = self.NETWORK_WORKERS if _is_network_filesystem(self.target_directory) else 1
+        self.workers = max(1, workers)
+    
+    @property
+    def categories(self) -> Dict[str, List[str]]:
+        """Category mappings in use."""
+        return self._categories
+    
+    @categories.setter
+    def categories(self, categories: Dict[str, List[str]]):
+        self._categories = categories
+        
+        # Build extension -> category lookup; the first category declaring an
+        # extension wins, so '.json' stays in 'Code' rather than 'Data'. Lower and
+        # upper case variants are both indexed so most lookups skip str.lower().
+        # Entries with wildcards (e.g. '*.tar.gz', 'backup_*') are filename
+        # patterns, compiled into a single regex with one marker group per pattern
+        self._ext_index = {}
+        self._pattern = None
+        self._pattern_groups = {}
+        patterns = []
+        for category, extensions in categories.items():
+            for extension in extensions:
+                if any(char in extension for char in '*?['):
+                    group = f"c{len(patterns)}"
+                    patterns.append(f"(?:{fnmatch.translate(extension)})(?P<{group}>)")
+                    self._pattern_groups[group] = category
+                else:
+                    self._ext_index.setdefault(extension.lower(), category)
+                    self._ext_index.setdefault(extension.upper(), category)
+        
+        if patterns:
+            self._pattern = re.compile('|'.join(patterns), re.IGNORECASE)
     
     def _setup_logger(self):
-        """Configure logging system."""
+        """Configure logging system, reusing the handlers already set up for the same log file."""
         self.logger = logging.getLogger('FileOrganizer')
         self.logger.setLevel(logging.DEBUG)
         
-        # Remove any existing handlers to avoid duplicates
-        for handler in self.logger.handlers[:]:
-            self.logger.removeHandler(handler)
-            handler.close()
+        # Detach handlers set up for other log files (but keep them open for
+        # reuse); handlers added by the host application are left alone
+        key = os.path.abspath(str(self.log_file))
+        for other_key, handlers in _HANDLER_CACHE.items():
+            if other_key != key:
+                for handler in handlers:
+                    self.logger.removeHandler(handler)
+        
+        if key in _HANDLER_CACHE:
+            for handler in _HANDLER_CACHE[key]:
+                if handler not in self.logger.handlers:
+                    self.logger.addHandler(handler)
+            return
         
         # File handler
-        file_handler = logging.FileHandler(self.log_file)
+        file_handler = logging.FileHandler(self.log_file, encoding='utf-8')
         file_handler.setLevel(logging.DEBUG)
         
         # Console handler
@@ -78,24 +225,73 @@ class FileOrganizer:
         # Add handlers
         self.logger.addHandler(file_handler)
         self.logger.addHandler(console_handler)
+        
+        _HANDLER_CACHE[key] = (file_handler, console_handler)
     
-    def _get_file_category(self, file_path: Path) -> str:
+    def _get_file_category(self, file_path: Union[str, Path]) -> str:
         """
-        Determine the category of a file based on its extension.
+        Determine the category of a file based on its name patterns or extension.
         
         Args:
-            file_path: Path object of the file
+            file_path: Path or name of the file
             
         Returns:
             Category name or 'Others' if no match found
         """
-        file_extension = file_path.suffix.lower()
+        return self._categorize_batch([file_path])[0]
+    
+    def _categorize_batch(self, names: List[Union[str, Path]]) -> List[str]:
+        """
+        Determine the categories of many files at once, from name patterns or extension.
         
-        for category, extensions in self.categories.items():
-            if file_extension in extensions:
-                return category
+        The lookups are bound once for the whole batch.
         
-        return 'Others'
+        Args:
+            names: Paths or names of the files
+            
+        Returns:
+            Category names ('Others' if no match found), in the same order as names
+        """
+        get = self._ext_index.get
+        splitext = os.path.splitext
+        pattern_match = self._pattern.match if self._pattern is not None else None
+        categories = []
+        
+        for name in names:
+            if pattern_match is not None:
+                match = pattern_match(os.path.basename(name))
+                if match:
+                    categories.append(self._pattern_groups[match.lastgroup])
+                    continue
+            
+            extension = splitext(name)[1]
+            categories.append(get(extension) or get(extension.lower(), 'Others'))
+        
+        return categories
+    
+    def _is_log_file(self, file_path: str) -> bool:
+        """
+        Check whether a path is this organizer's log file.
+        
+        Args:
+            file_path: File path to check
+            
+        Returns:
+            True if the path refers to the configured log file
+        """
+        return os.path.normcase(os.path.abspath(file_path)) == self._log_path
+    
+    def _now(self) -> str:
+        """
+        Get the current time as an ISO 8601 string.
+        
+        Derived from a monotonic clock offset from the wall time at startup, so
+        timestamps in the operation log never go backwards during a run.
+        
+        Returns:
+            ISO 8601 timestamp
+        """
+        return datetime.fromtimestamp(self._t0_wall + (time.monotonic() - self._t0_mono)).isoformat()
     
     def _create_category_folder(self, category: str) -> Path:
         """
@@ -119,7 +315,7 @@ class FileOrganizer:
         
         return category_path
     
-    def _move_file(self, file_path: Path, destination: Path) -> bool:
+    def _move_file(self, file_path: Union[str, Path], destination: Union[str, Path]) -> bool:
         """
         Move a file to the destination folder.
         
@@ -130,42 +326,228 @@ class FileOrganizer:
         Returns:
             True if successful, False otherwise
         """
+        # Work on plain strings; this runs once per file
+        file_path = os.fspath(file_path)
+        destination = os.fspath(destination)
+        file_name = os.path.basename(file_path)
+        
         try:
-            # Handle duplicate filenames
-            destination_file = destination / file_path.name
-            counter = 1
-            
-            while destination_file.exists():
-                name_parts = file_path.stem, file_path.suffix
-                new_name = f"{name_parts[0]}_{counter}{name_parts[1]}"
-                destination_file = destination / new_name
-                counter += 1
-            
-            shutil.move(str(file_path), str(destination_file))
-            self.logger.info(f"Moved: {file_path.name} -> {destination.name}/")
-            
-            # Log operation
-            self.operations_log.append({
-                'timestamp': datetime.now().isoformat(),
-                'action': 'move',
-                'source': str(file_path),
-                'destination': str(destination_file),
-                'status': 'success'
-            })
+            while True:
+                with self._lock:
+                    names = self._dest_listing.get(destination)
+                    if names is None:
+                        with os.scandir(destination) as entries:
+                            names = {self._name_key(entry.name) for entry in entries}
+                        self._dest_listing[destination] = names
+                    
+                    # Handle duplicate filenames
+                    new_name = file_name
+                    while self._name_key(new_name) in names:
+                        new_name = self._next_duplicate_name(destination, file_name)
+                    
+                    # Reserve the name so concurrent moves don't pick it too
+                    names.add(self._name_key(new_name))
+                
+                destination_file = os.path.join(destination, new_name)
+                
+                # The listing is cached for the whole run, so make sure a file
+                # created since then is never replaced; its name stays reserved
+                if not os.path.exists(destination_file):
+                    break
             
-            return True
+            try:
+                # Destination is inside the target directory, so this is normally
+                # a same-filesystem rename
+                os.rename(file_path, destination_file)
+            except OSError as e:
+                if e.errno != errno.EXDEV:
+                    with self._lock:
+                        names.discard(self._name_key(new_name))
+                    raise
+                shutil.move(file_path, destination_file)
             
         except Exception as e:
-            self.logger.error(f"Failed to move {file_path.name}: {e}")
-            self.operations_log.append({
-                'timestamp': datetime.now().isoformat(),
+            # Flush buffered "Moved" lines first so the log file stays in order
+            self._flush_move_log()
+            self.logger.error(f"Failed to move {file_name}: {e}")
+            self._log_operation({
+                'timestamp': self._now(),
                 'action': 'move',
-                'source': str(file_path),
-                'destination': str(destination),
+                'source': file_path,
+                'destination': destination,
                 'status': 'failed',
                 'error': str(e)
             })
             return False
+        
+        # The file has been moved; logging problems must not change that result
+        self._log_move(f"Moved: {file_name} -> {os.path.basename(destination)}/")
+        
+        # Log operation
+        self._log_operation({
+            'timestamp': self._now(),
+            'action': 'move',
+            'source': file_path,
+            'destination': destination_file,
+            'status': 'success'
+        })
+        
+        return True
+    
+    @staticmethod
+    def _name_key(name: str) -> str:
+        """
+        Get the key used to compare file names for collisions.
+        
+        Names are case-folded so that case variants (e.g. 'Report.pdf' and
+        'report.pdf') collide, as they do on case-insensitive filesystems.
+        
+        Args:
+            name: File name
+            
+        Returns:
+            Normalized file name
+        """
+        return os.path.normcase(name).casefold()
+    
+    def _next_duplicate_name(self, destination: str, file_name: str) -> str:
+        """
+        Pick a numbered name for a file whose name is taken in the destination folder.
+        
+        Must be called with the lock held, after the destination listing is cached.
+        
+        Args:
+            destination: Destination folder path
+            file_name: Original file name
+            
+        Returns:
+            New file name of the form 'stem_N.suffix', not yet reserved
+        """
+        names = self._dest_listing[destination]
+        stem, suffix = os.path.splitext(file_name)
+        key = (self._name_key(stem), self._name_key(suffix))
+        counters = self._max_suffix.setdefault(destination, {})
+        counter = counters.get(key)
+        
+        # First collision for this name: find the highest existing counter
+        if counter is None:
+            pattern = re.compile(re.escape(key[0]) + r'_(\d+)' + re.escape(key[1]))
+            counter = max((int(m.group(1)) for m in map(pattern.fullmatch, names) if m), default=0)
+        
+        counter += 1
+        new_name = f"{stem}_{counter}{suffix}"
+        while self._name_key(new_name) in names:
+            counter += 1
+            new_name = f"{stem}_{counter}{suffix}"
+        counters[key] = counter
+        
+        return new_name
+    
+    def _move_files(self, moves: List[Tuple[str, str]]) -> List[bool]:
+        """
+        Move a batch of files, using a thread pool when more than one worker is configured.
+        
+        Args:
+            moves: List of (source file, destination folder) pairs
+            
+        Returns:
+            List of results from _move_file, in the same order as moves
+        """
+        if self.workers == 1 or len(moves) <= 1:
+            return [self._move_file(file_path, destination) for file_path, destination in moves]
+        
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            return list(executor.map(lambda move: self._move_file(*move), moves))
+    
+    def _organize_planned(self, planned: List[Tuple[str, str]], stats: Dict[str, int]):
+        """
+        Create the category folders needed by a batch of files, then move the files.
+        
+        Args:
+            planned: List of (source file, category) pairs
+            stats: Statistics dictionary to update
+        """
+        # Create each needed category folder once, before any file is moved
+        destinations = {}
+        for category in sorted({category for _, category in planned}):
+            try:
+                destinations[category] = str(self._create_category_folder(category))
+                stats['categories_created'] += 1
+            except Exception:
+                pass
+        
+        moves = [(file_path, destinations[category]) for file_path, category in planned
+                 if category in destinations]
+        stats['failed_files'] += len(planned) - len(moves)
+        
+        # Move files
+        results = self._move_files(moves)
+        stats['organized_files'] += sum(results)
+        stats['failed_files'] += len(results) - sum(results)
+        
+        # Keep "Moved" lines ahead of the summary in the log file
+        self._flush_move_log()
+    
+    def _scan_directory(self, directory: str, skip_dirs=()) -> Tuple[str, List[os.DirEntry], List[str]]:
+        """
+        List a single directory, splitting its entries into files and subdirectories.
+        
+        Args:
+            directory: Directory path to scan
+            skip_dirs: Names of subdirectories not to descend into (optional)
+            
+        Returns:
+            Tuple of (directory, file entries, subdirectory paths)
+        """
+        files = []
+        subdirs = []
+        
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.is_dir():
+                        # Like os.walk, don't descend into symlinked directories
+                        if not entry.is_symlink() and entry.name not in skip_dirs:
+                            subdirs.append(entry.path)
+                    else:
+                        files.append(entry)
+        except OSError as e:
+            self.logger.debug(f"Cannot scan directory {directory}: {e}")
+        
+        return directory, files, subdirs
+    
+    def _collect_paths(self, root: Path, skip_dirs=()) -> List[Tuple[str, List[os.DirEntry]]]:
+        """
+        Walk a directory tree, scanning directories concurrently.
+        
+        Directory listing is dominated by filesystem latency rather than CPU, so
+        each directory is scanned in its own worker thread.
+        
+        Args:
+            root: Root directory of the tree
+            skip_dirs: Names of subdirectories of root not to descend into (optional)
+            
+        Returns:
+            List of (directory, file entries) pairs, one per directory in the tree,
+            sorted by directory path (so root comes first)
+        """
+        collected = []
+        max_workers = min(32, (os.cpu_count() or 1) * 4)
+        
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            pending = {executor.submit(self._scan_directory, str(root), skip_dirs)}
+            
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    directory, files, subdirs = future.result()
+                    collected.append((directory, files))
+                    pending.update(executor.submit(self._scan_directory, d) for d in subdirs)
+        
+        # Scans finish in arbitrary order; sort so runs are repeatable, e.g. which
+        # of several same-named files keeps its original name
+        collected.sort(key=lambda item: item[0])
+        return collected
     
     def organize(self, dry_run: bool = False) -> Dict[str, int]:
         """
@@ -186,67 +568,57 @@ class FileOrganizer:
         }
         
         self.logger.info(f"Starting file organization in: {self.target_directory}")
+        self._dest_listing.clear()
+        self._max_suffix.clear()
         if dry_run:
             self.logger.info("DRY RUN MODE - No files will be moved")
         
         try:
             # Get all files in target directory (non-recursive by default)
-            files = [f for f in self.target_directory.iterdir() if f.is_file()]
+            with os.scandir(self.target_directory) as entries:
+                files = [entry for entry in entries if entry.is_file()]
             stats['total_files'] = len(files)
             
             self.logger.info(f"Found {stats['total_files']} files to process")
             
-            # Create a dict to track categories created
-            created_categories = set()
+            planned = []
+            names = [entry.name for entry in files]
             
-            for file_path in files:
+            for entry, name, category in zip(files, names, self._categorize_batch(names)):
                 # Skip the log file itself
-                if file_path.name == 'file_organizer.log' or file_path.name == 'organization_log.json':
+                if name in _SKIP_NAMES or (name == self._log_name and self._is_log_file(entry.path)):
                     stats['skipped_files'] += 1
                     continue
                 
-                category = self._get_file_category(file_path)
-                
                 if dry_run:
-                    self.logger.info(f"[DRY RUN] Would move: {file_path.name} -> {category}/")
+                    self.logger.info(f"[DRY RUN] Would move: {name} -> {category}/")
                     stats['organized_files'] += 1
                 else:
-                    # Create category folder
-                    if category not in created_categories:
-                        try:
-                            self._create_category_folder(category)
-                            created_categories.add(category)
-                            stats['categories_created'] += 1
-                        except Exception:
-                            stats['failed_files'] += 1
-                            continue
-                    
-                    # Move file
-                    destination = self.target_directory / category
-                    if self._move_file(file_path, destination):
-                        stats['organized_files'] += 1
-                    else:
-                        stats['failed_files'] += 1
+                    planned.append((entry.path, category))
+            
+            if not dry_run:
+                self._open_run_logs()
+            self._organize_planned(planned, stats)
             
             self.logger.info(f"Organization complete: {stats['organized_files']} files organized, "
                            f"{stats['failed_files']} failed, {stats['skipped_files']} skipped")
             
-            # Save operation log
-            if not dry_run:
-                self._save_operation_log()
-            
             return stats
             
         except Exception as e:
             self.logger.error(f"Fatal error during organization: {e}", exc_info=True)
             raise
+        
+        finally:
+            self.close()
     
-    def organize_recursive(self, dry_run: bool = False) -> Dict[str, int]:
+    def organize_recursive(self, dry_run: bool = False, incremental: bool = False) -> Dict[str, int]:
         """
         Recursively organize files in the target directory and all subdirectories.
         
         Args:
             dry_run: If True, print what would be done without actually moving files
+            incremental: If True, skip the run when nothing changed since the last incremental run
             
         Returns:
             Dictionary with statistics about the organization
@@ -261,99 +633,209 @@ class FileOrganizer:
         }
         
         self.logger.info(f"Starting recursive file organization in: {self.target_directory}")
+        self._dest_listing.clear()
+        self._max_suffix.clear()
+        
+        if incremental and self._is_unchanged():
+            self.logger.info("No changes since the last run - nothing to organize")
+            return stats
         
         try:
-            created_categories = set()
+            target = str(self.target_directory)
+            planned = []
             
-            # Walk through all directories
-            for root, dirs, files in os.walk(self.target_directory):
-                root_path = Path(root)
-                
-                # Skip the main directory for now (will process it separately)
-                if root_path == self.target_directory:
-                    continue
-                
+            # Top-level category folders are pruned from the walk, but categories
+            # with nested names (e.g. 'Media/Photos') can still be reached
+            nested_folders = {os.path.normpath(os.path.join(target, category)): category
+                              for category in self.categories
+                              if os.sep in category or (os.altsep and os.altsep in category)}
+            
+            # Walk through all directories, including the target directory itself.
+            # Category folders (and 'Others') hold already-organized files, so don't descend into them
+            collected = self._collect_paths(self.target_directory, skip_dirs=set(self.categories) | {'Others'})
+            for root, files in collected:
                 stats['directories_processed'] += 1
                 self.logger.debug(f"Processing directory: {root}")
+                folder_category = nested_folders.get(os.path.normpath(root))
                 
-                for filename in files:
-                    file_path = root_path / filename
-                    
+                names = [entry.name for entry in files]
+                
+                for entry, name, category in zip(files, names, self._categorize_batch(names)):
                     # Skip log files
-                    if filename in ['file_organizer.log', 'organization_log.json']:
+                    if name in _SKIP_NAMES or (name == self._log_name and self._is_log_file(entry.path)):
                         stats['skipped_files'] += 1
                         continue
                     
                     stats['total_files'] += 1
-                    category = self._get_file_category(file_path)
                     
-                    if dry_run:
-                        self.logger.info(f"[DRY RUN] Would move: {file_path.name} -> {category}/")
-                        stats['organized_files'] += 1
-                    else:
-                        if category not in created_categories:
-                            try:
-                                self._create_category_folder(category)
-                                created_categories.add(category)
-                                stats['categories_created'] += 1
-                            except Exception:
-                                stats['failed_files'] += 1
-                                continue
-                        
-                        destination = self.target_directory / category
-                        if self._move_file(file_path, destination):
-                            stats['organized_files'] += 1
-                        else:
-                            stats['failed_files'] += 1
-            
-            # Now process files in the main directory
-            files_in_root = [f for f in self.target_directory.iterdir() 
-                           if f.is_file() and f.name not in ['file_organizer.log', 'organization_log.json']]
-            
-            for file_path in files_in_root:
-                stats['total_files'] += 1
-                category = self._get_file_category(file_path)
-                
-                if dry_run:
-                    self.logger.info(f"[DRY RUN] Would move: {file_path.name} -> {category}/")
-                    stats['organized_files'] += 1
-                else:
-                    if category not in created_categories:
-                        try:
-                            self._create_category_folder(category)
-                            created_categories.add(category)
-                            stats['categories_created'] += 1
-                        except Exception:
-                            stats['failed_files'] += 1
-                            continue
+                    # Skip files that are already in their category folder
+                    if category == folder_category:
+                        stats['skipped_files'] += 1
+                        continue
                     
-                    destination = self.target_directory / category
-                    if self._move_file(file_path, destination):
+                    if dry_run:
+                        self.logger.info(f"[DRY RUN] Would move: {name} -> {category}/")
                         stats['organized_files'] += 1
                     else:
-                        stats['failed_files'] += 1
+                        planned.append((entry.path, category))
+            
+            if not dry_run:
+                self._open_run_logs()
+            self._organize_planned(planned, stats)
             
             self.logger.info(f"Recursive organization complete: {stats['organized_files']} files organized")
             
-            if not dry_run:
-                self._save_operation_log()
+            # Failed moves must be retried next time, so only record a clean run
+            if incremental and not dry_run and stats['failed_files'] == 0:
+                self._save_state([root for root, _ in collected])
             
             return stats
             
         except Exception as e:
             self.logger.error(f"Fatal error during recursive organization: {e}", exc_info=True)
             raise
+        
+        finally:
+            self.close()
     
-    def _save_operation_log(self):
-        """Save operation log to JSON file."""
-        log_path = self.target_directory / "organization_log.json"
+    def _is_unchanged(self) -> bool:
+        """
+        Check whether the tree is unchanged since the state was last saved.
+        
+        Adding, removing or renaming a file changes the modification time of
+        its directory, so comparing directory mtimes is enough to tell whether
+        there is anything new to organize.
+        
+        Returns:
+            True if the saved state is still valid, False otherwise
+        """
+        state_path = self.target_directory / ".file_organizer_state"
+        
+        try:
+            with open(state_path, 'r') as f:
+                state = json.load(f)
+            
+            if state['categories'] != self.categories:
+                return False
+            
+            return all(os.stat(directory).st_mtime_ns == mtime
+                       for directory, mtime in state['directories'].items())
+        except (OSError, ValueError, KeyError, TypeError, AttributeError):
+            return False
+    
+    def _save_state(self, directories: List[str]):
+        """
+        Record directory modification times for later incremental runs.
+        
+        Args:
+            directories: Directories that were walked
+        """
+        state_path = self.target_directory / ".file_organizer_state"
+        
+        try:
+            # Create the file before reading mtimes, so writing it doesn't
+            # change the target directory's mtime afterwards
+            state_path.touch()
+            
+            mtimes = {}
+            for directory in directories:
+                try:
+                    mtimes[directory] = os.stat(directory).st_mtime_ns
+                except OSError:
+                    pass
+            
+            with open(state_path, 'w') as f:
+                json.dump({'categories': self.categories, 'directories': mtimes}, f)
+        except Exception as e:
+            self.logger.error(f"Failed to save organization state: {e}")
+    
+    def _open_run_logs(self):
+        """
+        Open the logs written once per moved file.
+        
+        The operation log is written as one JSON record per line. Per-file
+        "Moved" lines bypass the logging framework and are appended straight to
+        the log file through a buffered handle, in the same format.
+        """
+        log_path = self.target_directory / "organization_log.ndjson"
+        
+        try:
+            self._op_log_fh = open(log_path, 'w', buffering=1 << 20)
+        except Exception as e:
+            self.logger.error(f"Failed to open operation log: {e}")
+        
+        try:
+            self._move_log_fh = open(self.log_file, 'a', buffering=1 << 16,
+                                     encoding='utf-8', errors='backslashreplace')
+        except Exception as e:
+            self.logger.error(f"Failed to open log file: {e}")
+    
+    def _log_move(self, message: str):
+        """
+        Write a per-file message to the log file, or to the logger if no run is in progress.
+        
+        Args:
+            message: Message to log
+        """
+        if self._move_log_fh is None:
+            self.logger.info(message)
+            return
+        
+        line = f"{time.strftime('%Y-%m-%d %H:%M:%S')} - {self.logger.name} - INFO - {message}\n"
+        try:
+            with self._lock:
+                self._move_log_fh.write(line)
+        except Exception as e:
+            self.logger.error(f"Failed to write log file: {e}")
+    
+    def _flush_move_log(self):
+        """Write out buffered per-file lines, so they come before messages logged next."""
+        if self._move_log_fh is None:
+            return
+        
+        try:
+            with self._lock:
+                self._move_log_fh.flush()
+        except Exception as e:
+            self.logger.error(f"Failed to write log file: {e}")
+    
+    def _log_operation(self, record: Dict[str, str]):
+        """
+        Append a record to the operation log.
+        
+        Args:
+            record: Operation details to log
+        """
+        if self._op_log_fh is None:
+            return
+        
+        line = json.dumps(record) + "\n"
+        try:
+            with self._lock:
+                self._op_log_fh.write(line)
+        except Exception as e:
+            self.logger.error(f"Failed to write operation log: {e}")
+    
+    def close(self):
+        """Flush and close the operation and move logs if they are open."""
+        if self._move_log_fh is not None:
+            try:
+                self._move_log_fh.close()
+            except Exception as e:
+                self.logger.error(f"Failed to write log file: {e}")
+            finally:
+                self._move_log_fh = None
+        
+        if self._op_log_fh is None:
+            return
         
         try:
-            with open(log_path, 'w') as f:
-                json.dump(self.operations_log, f, indent=2)
-            self.logger.info(f"Operation log saved to: {log_path}")
+            self._op_log_fh.close()
+            self.logger.info(f"Operation log saved to: {self._op_log_fh.name}")
         except Exception as e:
             self.logger.error(f"Failed to save operation log: {e}")
+        finally:
+            self._op_log_fh = None
     
     def get_category_summary(self) -> Dict[str, int]:
         """
@@ -364,9 +846,11 @@ class FileOrganizer:
         """
         summary = {}
         
-        for category_path in self.target_directory.iterdir():
-            if category_path.is_dir() and category_path.name in self.categories:
-                file_count = len([f for f in category_path.iterdir() if f.is_file()])
-                summary[category_path.name] = file_count
+        with os.scandir(self.target_directory) as entries:
+            for category_entry in entries:
+                if category_entry.is_dir() and category_entry.name in self.categories:
+                    with os.scandir(category_entry.path) as category_files:
+                        file_count = sum(1 for f in category_files if f.is_file())
+                    summary[category_entry.name] = file_count
         
         return summary
@@ -3,7 +3,11 @@ from pathlib import Path
 import tempfile
 import shutil
 import logging
-from organizer import FileOrganizer
+import json
+import os
+import errno
+from unittest.mock import patch
+from organizer import FileOrganizer, close_loggers
 
 
 class TestFileOrganizer(unittest.TestCase):
@@ -17,6 +21,7 @@ class TestFileOrganizer(unittest.TestCase):
     def tearDown(self):
         """Remove the temporary directory after testing."""
         # Close any logger handlers first
+        close_loggers()
         for handler in logging.root.handlers[:]:
             handler.close()
             logging.root.removeHandler(handler)
@@ -56,6 +61,15 @@ class TestFileOrganizer(unittest.TestCase):
         self.assertIsNotNone(organizer)
         self.assertEqual(organizer.target_directory, self.test_path)
     
+    def test_default_workers(self):
+        """Test that the default worker count depends on the filesystem type."""
+        with patch('organizer._is_network_filesystem', return_value=False):
+            self.assertEqual(FileOrganizer(str(self.test_path)).workers, 1)
+        
+        with patch('organizer._is_network_filesystem', return_value=True):
+            organizer = FileOrganizer(str(self.test_path))
+            self.assertEqual(organizer.workers, FileOrganizer.NETWORK_WORKERS)
+    
     def test_invalid_directory(self):
         """Test initialization with invalid directory."""
         with self.assertRaises(ValueError):
@@ -112,6 +126,147 @@ class TestFileOrganizer(unittest.TestCase):
         self.assertTrue((self.test_path / 'Images' / 'image.jpg').exists())
         self.assertTrue((self.test_path / 'Code' / 'script.py').exists())
     
+    def test_operation_log(self):
+        """Test that each move is written to the operation log."""
+        self.create_test_files()
+        organizer = FileOrganizer(str(self.test_path))
+        
+        stats = organizer.organize()
+        
+        log_path = self.test_path / 'organization_log.ndjson'
+        records = [json.loads(line) for line in log_path.read_text().splitlines()]
+        self.assertEqual(len(records), stats['organized_files'])
+        self.assertTrue(all(record['status'] == 'success' for record in records))
+    
+    def test_moves_written_to_log_file(self):
+        """Test that per-file moves are recorded in the log file."""
+        (self.test_path / 'report.pdf').touch()
+        organizer = FileOrganizer(str(self.test_path))
+        
+        organizer.organize()
+        
+        log_text = Path(organizer.log_file).read_text()
+        self.assertIn("FileOrganizer - INFO - Moved: report.pdf -> Documents/", log_text)
+        self.assertLess(log_text.index("Moved: report.pdf"), log_text.index("Organization complete"))
+    
+    def test_undecodable_filename_counts_as_organized(self):
+        """Test that a moved file with an undecodable name is not reported as failed."""
+        name = os.fsdecode(b'\xff_report.pdf')
+        try:
+            (self.test_path / name).touch()
+        except (OSError, UnicodeEncodeError):
+            self.skipTest("Filesystem does not accept undecodable filenames")
+        
+        organizer = FileOrganizer(str(self.test_path))
+        stats = organizer.organize()
+        
+        self.assertEqual(stats['organized_files'], 1)
+        self.assertEqual(stats['failed_files'], 0)
+        self.assertTrue((self.test_path / 'Documents' / name).exists())
+    
+    def test_organize_recursive(self):
+        """Test recursive organization of nested directories."""
+        nested = self.test_path / 'a' / 'b'
+        nested.mkdir(parents=True)
+        (self.test_path / 'a' / 'notes.txt').touch()
+        (nested / 'photo.png').touch()
+        (self.test_path / 'top.pdf').touch()
+        
+        organizer = FileOrganizer(str(self.test_path))
+        stats = organizer.organize_recursive()
+        
+        self.assertEqual(stats['organized_files'], 3)
+        self.assertEqual(stats['failed_files'], 0)
+        self.assertTrue((self.test_path / 'Documents' / 'notes.txt').exists())
+        self.assertTrue((self.test_path / 'Documents' / 'top.pdf').exists())
+        self.assertTrue((self.test_path / 'Images' / 'photo.png').exists())
+    
+    def test_organize_recursive_is_idempotent(self):
+        """Test that re-running recursive organization leaves organized files alone."""
+        (self.test_path / 'a').mkdir()
+        (self.test_path / 'a' / 'notes.txt').touch()
+        (self.test_path / 'README').touch()
+        
+        organizer = FileOrganizer(str(self.test_path))
+        organizer.organize_recursive()
+        stats = organizer.organize_recursive()
+        
+        self.assertEqual(stats['organized_files'], 0)
+        self.assertEqual(stats['directories_processed'], 2)
+        self.assertEqual(sorted(p.name for p in (self.test_path / 'Documents').iterdir()), ['notes.txt'])
+        self.assertEqual(sorted(p.name for p in (self.test_path / 'Others').iterdir()), ['README'])
+    
+    def test_organize_recursive_incremental(self):
+        """Test that incremental runs skip unchanged trees and pick up new files."""
+        (self.test_path / 'a').mkdir()
+        (self.test_path / 'a' / 'notes.txt').touch()
+        
+        organizer = FileOrganizer(str(self.test_path))
+        stats = organizer.organize_recursive(incremental=True)
+        self.assertEqual(stats['organized_files'], 1)
+        
+        stats = organizer.organize_recursive(incremental=True)
+        self.assertEqual(stats['total_files'], 0)
+        
+        (self.test_path / 'a' / 'photo.png').touch()
+        stats = organizer.organize_recursive(incremental=True)
+        self.assertEqual(stats['organized_files'], 1)
+        self.assertTrue((self.test_path / 'Images' / 'photo.png').exists())
+    
+    def test_organize_recursive_nested_category(self):
+        """Test that files already in a nested category folder are left in place."""
+        custom_categories = {'Media/Photos': ['.jpg']}
+        photos = self.test_path / 'Media' / 'Photos'
+        cwd = os.getcwd()
+        
+        # Both an absolute target and a relative one, as with 'cli.py . --recursive'
+        for target in (str(self.test_path), '.'):
+            with self.subTest(target=target):
+                photos.mkdir(parents=True)
+                (photos / 'a.jpg').write_text("a")
+                (self.test_path / 'b.jpg').write_text("b")
+                
+                os.chdir(self.test_dir)
+                try:
+                    organizer = FileOrganizer(target, categories=custom_categories)
+                    stats = organizer.organize_recursive()
+                finally:
+                    os.chdir(cwd)
+                
+                self.assertEqual(stats['organized_files'], 1)
+                self.assertEqual((photos / 'a.jpg').read_text(), "a")
+                self.assertEqual((photos / 'b.jpg').read_text(), "b")
+                self.assertEqual(sorted(p.name for p in photos.iterdir()), ['a.jpg', 'b.jpg'])
+                shutil.rmtree(self.test_path / 'Media')
+    
+    def test_organize_recursive_is_deterministic(self):
+        """Test that the first directory in path order keeps a duplicated name."""
+        for i in range(8):
+            folder = self.test_path / f'd{i}' / 'e'
+            folder.mkdir(parents=True)
+            (folder / 'r.pdf').write_text(f"d{i}")
+        
+        organizer = FileOrganizer(str(self.test_path), workers=1)
+        organizer.organize_recursive()
+        
+        documents = self.test_path / 'Documents'
+        self.assertEqual((documents / 'r.pdf').read_text(), "d0")
+        self.assertEqual((documents / 'r_7.pdf').read_text(), "d7")
+    
+    def test_organize_with_workers(self):
+        """Test organization with a thread pool moving files."""
+        for i in range(20):
+            (self.test_path / f'doc{i}.pdf').touch()
+            (self.test_path / 'nested').mkdir(exist_ok=True)
+            (self.test_path / 'nested' / f'doc{i}.pdf').touch()
+        
+        organizer = FileOrganizer(str(self.test_path), workers=4)
+        stats = organizer.organize_recursive()
+        
+        self.assertEqual(stats['organized_files'], 40)
+        self.assertEqual(stats['failed_files'], 0)
+        self.assertEqual(len(list((self.test_path / 'Documents').iterdir())), 40)
+    
     def test_dry_run(self):
         """Test dry run mode (no actual file movement)."""
         self.create_test_files()
@@ -145,6 +300,31 @@ class TestFileOrganizer(unittest.TestCase):
         category = organizer._get_file_category(test_path)
         self.assertEqual(category, 'Media')
     
+    def test_filename_pattern_categories(self):
+        """Test that wildcard entries match whole filenames before extensions."""
+        custom_categories = {
+            'Backups': ['*.tar.gz', 'backup_*'],
+            'Archives': ['.gz', '.zip']
+        }
+        
+        organizer = FileOrganizer(str(self.test_path), categories=custom_categories)
+        
+        self.assertEqual(organizer._get_file_category(self.test_path / 'site.TAR.GZ'), 'Backups')
+        self.assertEqual(organizer._get_file_category(self.test_path / 'backup_2024.zip'), 'Backups')
+        self.assertEqual(organizer._get_file_category(self.test_path / 'logs.gz'), 'Archives')
+        self.assertEqual(organizer._get_file_category(self.test_path / 'notes.txt'), 'Others')
+    
+    def test_overlapping_extensions(self):
+        """Test that the first category declaring an extension wins."""
+        organizer = FileOrganizer(str(self.test_path))
+        
+        self.assertEqual(organizer._get_file_category(self.test_path / 'config.json'), 'Code')
+        self.assertEqual(organizer._get_file_category(self.test_path / 'PHOTO.JPG'), 'Images')
+        
+        # Reassigning categories rebuilds the lookup
+        organizer.categories = {'Data': ['.json']}
+        self.assertEqual(organizer._get_file_category(self.test_path / 'config.json'), 'Data')
+    
     def test_duplicate_filename_handling(self):
         """Test handling of duplicate filenames."""
         # Create two files with the same name
@@ -165,6 +345,110 @@ class TestFileOrganizer(unittest.TestCase):
         self.assertTrue(result)
         self.assertTrue((doc_folder / 'test_1.txt').exists())
     
+    def test_cross_filesystem_move_falls_back_to_copy(self):
+        """Test that an EXDEV rename error falls back to shutil.move."""
+        doc_folder = self.test_path / 'Documents'
+        doc_folder.mkdir()
+        (self.test_path / 'report.pdf').write_text("Report")
+        
+        organizer = FileOrganizer(str(self.test_path))
+        
+        with patch('organizer.os.rename', side_effect=OSError(errno.EXDEV, "Cross-device link")):
+            result = organizer._move_file(self.test_path / 'report.pdf', doc_folder)
+        
+        self.assertTrue(result)
+        self.assertFalse((self.test_path / 'report.pdf').exists())
+        self.assertEqual((doc_folder / 'report.pdf').read_text(), "Report")
+    
+    def test_failed_rename_releases_reserved_name(self):
+        """Test that a failed move does not keep its destination name reserved."""
+        doc_folder = self.test_path / 'Documents'
+        doc_folder.mkdir()
+        (self.test_path / 'report.pdf').write_text("Report")
+        
+        organizer = FileOrganizer(str(self.test_path))
+        
+        with patch('organizer.os.rename', side_effect=OSError(errno.EACCES, "Permission denied")):
+            self.assertFalse(organizer._move_file(self.test_path / 'report.pdf', doc_folder))
+        
+        self.assertTrue(organizer._move_file(self.test_path / 'report.pdf', doc_folder))
+        self.assertEqual((doc_folder / 'report.pdf').read_text(), "Report")
+    
+    def test_repeated_duplicate_filenames(self):
+        """Test that several colliding files each get a distinct name."""
+        doc_folder = self.test_path / 'Documents'
+        doc_folder.mkdir()
+        (doc_folder / 'test.txt').write_text("Original")
+        (doc_folder / 'test_1.txt').write_text("Original 1")
+        
+        organizer = FileOrganizer(str(self.test_path))
+        
+        for i in range(3):
+            source = self.test_path / 'test.txt'
+            source.write_text(f"New {i}")
+            self.assertTrue(organizer._move_file(source, doc_folder))
+        
+        self.assertEqual((doc_folder / 'test.txt').read_text(), "Original")
+        self.assertEqual((doc_folder / 'test_1.txt').read_text(), "Original 1")
+        self.assertEqual((doc_folder / 'test_2.txt').read_text(), "New 0")
+        self.assertEqual((doc_folder / 'test_3.txt').read_text(), "New 1")
+        self.assertEqual((doc_folder / 'test_4.txt').read_text(), "New 2")
+    
+    def test_duplicate_filename_after_highest_counter(self):
+        """Test that a colliding file is numbered after the highest existing counter."""
+        doc_folder = self.test_path / 'Documents'
+        doc_folder.mkdir()
+        (doc_folder / 'test.txt').touch()
+        (doc_folder / 'test_127.txt').touch()
+        (self.test_path / 'test.txt').touch()
+        
+        organizer = FileOrganizer(str(self.test_path))
+        
+        self.assertTrue(organizer._move_file(self.test_path / 'test.txt', doc_folder))
+        self.assertTrue((doc_folder / 'test_128.txt').exists())
+    
+    def test_case_variant_duplicate_filenames(self):
+        """Test that names differing only in case are treated as duplicates."""
+        doc_folder = self.test_path / 'Documents'
+        doc_folder.mkdir()
+        (doc_folder / 'report.pdf').write_text("Original")
+        (self.test_path / 'Report.pdf').write_text("New")
+        
+        organizer = FileOrganizer(str(self.test_path))
+        
+        self.assertTrue(organizer._move_file(self.test_path / 'Report.pdf', doc_folder))
+        self.assertEqual((doc_folder / 'report.pdf').read_text(), "Original")
+        self.assertEqual((doc_folder / 'Report_1.pdf').read_text(), "New")
+    
+    def test_case_variant_sources_in_one_run(self):
+        """Test that sources differing only in case both survive a recursive run."""
+        for folder, name in (('a', 'IMG.JPG'), ('b', 'img.jpg')):
+            (self.test_path / folder).mkdir()
+            (self.test_path / folder / name).write_text(folder)
+        
+        organizer = FileOrganizer(str(self.test_path))
+        stats = organizer.organize_recursive()
+        
+        self.assertEqual(stats['organized_files'], 2)
+        contents = sorted(p.read_text() for p in (self.test_path / 'Images').iterdir())
+        self.assertEqual(contents, ['a', 'b'])
+    
+    def test_file_created_after_listing_is_not_replaced(self):
+        """Test that a file appearing after the destination was listed is not overwritten."""
+        doc_folder = self.test_path / 'Documents'
+        doc_folder.mkdir()
+        (self.test_path / 'first.pdf').touch()
+        
+        organizer = FileOrganizer(str(self.test_path))
+        self.assertTrue(organizer._move_file(self.test_path / 'first.pdf', doc_folder))
+        
+        (doc_folder / 'late.pdf').write_text("Late")
+        (self.test_path / 'late.pdf').write_text("Moved")
+        
+        self.assertTrue(organizer._move_file(self.test_path / 'late.pdf', doc_folder))
+        self.assertEqual((doc_folder / 'late.pdf').read_text(), "Late")
+        self.assertEqual((doc_folder / 'late_1.pdf').read_text(), "Moved")
+    
     def test_logger_setup(self):
         """Test that logger is properly configured."""
         organizer = FileOrganizer(str(self.test_path))
@@ -172,6 +456,42 @@ class TestFileOrganizer(unittest.TestCase):
         self.assertIsNotNone(organizer.logger)
         self.assertTrue(str(organizer.log_file).endswith('file_organizer.log'))
     
+    def test_custom_log_file_is_skipped(self):
+        """Test that a custom log file inside the target directory is not moved."""
+        (self.test_path / 'report.pdf').touch()
+        log_file = self.test_path / 'run.txt'
+        
+        organizer = FileOrganizer(str(self.test_path), log_file=str(log_file))
+        stats = organizer.organize()
+        
+        self.assertEqual(stats['organized_files'], 1)
+        self.assertTrue(log_file.exists())
+    
+    def test_log_file_outside_target_does_not_skip_same_name(self):
+        """Test that files sharing the name of an external log file are still organized."""
+        log_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, log_dir, True)
+        (self.test_path / 'notes.txt').touch()
+        
+        organizer = FileOrganizer(str(self.test_path), log_file=os.path.join(log_dir, 'notes.txt'))
+        stats = organizer.organize()
+        
+        self.assertEqual(stats['organized_files'], 1)
+        self.assertTrue((self.test_path / 'Documents' / 'notes.txt').exists())
+    
+    def test_logger_reused_for_same_log_file(self):
+        """Test that instances sharing a log file share one logger."""
+        first = FileOrganizer(str(self.test_path))
+        second = FileOrganizer(str(self.test_path))
+        
+        self.assertIs(first.logger, second.logger)
+        self.assertIs(first.logger, logging.getLogger('FileOrganizer'))
+        self.assertEqual(len(first.logger.handlers), 2)
+        
+        # Switching log files swaps the handlers instead of stacking them
+        FileOrganizer(str(self.test_path), log_file=str(self.test_path / 'other.log'))
+        self.assertEqual(len(first.logger.handlers), 2)
+    
     def test_get_category_summary(self):
         """Test category summary generation."""
         self.create_test_files()
@@ -196,6 +516,7 @@ class TestFileOrganizerEdgeCases(unittest.TestCase):
     def tearDown(self):
         """Remove the temporary directory after testing."""
         # Close any logger handlers first
+        close_loggers()
         for handler in logging.root.handlers[:]:
             handler.close()
             logging.root.removeHandler(handler)